@@ -1,6 +1,7 @@
 from datetime import datetime
-from random import randint
+from itertools import count
 from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from typing import Any
 
 from sqlmodel import create_engine
@@ -9,28 +10,37 @@ sqlite_file_name = "database.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
 
 connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, connect_args=connect_args)
+engine = create_engine(
+    sqlite_url,
+    connect_args=connect_args,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    query_cache_size=1200,
+)
 
-app = FastAPI(root_path="/api/v1")
+app = FastAPI(root_path="/api/v1", default_response_class=ORJSONResponse)
 
 @app.get("/")
 async def root():
     return {"message": "Hello world!"}
 
-data : Any = [
-    {
+data : dict[int, Any] = {
+    1: {
         "campaign_id": 1,
         "name": "Summer Launch",
         "due_date": datetime.now(),
         "created_at": datetime.now()
     },
-    {
+    2: {
         "campaign_id": 2,
         "name": "Black Friday",
         "due_date": datetime.now(),
         "created_at": datetime.now()
     }
-]
+}
+
+campaign_ids = count(len(data) + 1)
 
 """
 Campaigns
@@ -42,50 +52,49 @@ Campaigns
 
 @app.get("/campaigns")
 async def read_campaigns():
-    return {"campaigns": data}
+    return {"campaigns": list(data.values())}
 
 @app.get("/campaigns/{id}")
 async def read_campaign(id: int):
-    for campaign in data:
-        if campaign.get("campaign_id") == id:
-            return {"campaign": campaign}
-    raise HTTPException(status_code=404)
+    campaign = data.get(id)
+    if campaign is None:
+        raise HTTPException(status_code=404)
+    return {"campaign": campaign}
 
 @app.post("/campaigns", status_code=201)
 async def create_campaign(body: dict[str, Any]):
 
+    new_id = next(campaign_ids)
     new : Any = {
-        "campaign_id": randint(100, 1000),
+        "campaign_id": new_id,
         "name": body.get("name"),
         "due_date": body.get("due_date"),
         "created_at": datetime.now()
     }
     
-    data.append(new)
+    data[new_id] = new
     return {"campaign": new}
 
 @app.put("/campaigns/{id}",)
 async def delete_campaign(id: int, body: dict[str, Any]):
 
-    for index, campaign in enumerate(data):
-        if campaign.get("campaign_id") == id:
-
-            updated : Any = {
-                "campaign_id": id,
-                "name": body.get("name"),
-                "due_date": body.get("due_date"),
-                "created_at": campaign.get("created_at")
-            }
-            data[index] = updated
-            return {"campaign": updated}
-    raise HTTPException(status_code=404)
+    campaign = data.get(id)
+    if campaign is None:
+        raise HTTPException(status_code=404)
+
+    updated : Any = {
+        "campaign_id": id,
+        "name": body.get("name"),
+        "due_date": body.get("due_date"),
+        "created_at": campaign.get("created_at")
+    }
+    data[id] = updated
+    return {"campaign": updated}
     
 
 @app.delete("/campaigns/{id}",)
 async def update_campaign(id: int):
 
-    for index, campaign in enumerate(data):
-        if campaign.get("campaign_id") == id:
-            data.pop(index)
-            return Response(status_code=204)
-    raise HTTPException(status_code=404)
\ No newline at end of file
+    if data.pop(id, None) is None:
+        raise HTTPException(status_code=404)
+    return Response(status_code=204)
\ No newline at end of file